@@ -9,9 +9,8 @@ __email__ = "jake.nunemaker@nrel.gov"
 from pathlib import Path
 
 import yaml
-from yaml import Dumper
 
-from ORBIT.core import loader
+from ORBIT.core import Dumper, loader
 
 
 def load_config(filepath):
@@ -247,22 +247,17 @@ class VesselStorage(simpy.FilterStore):
 
         Parameters
         ----------
-        _type : str
-            Type of item to retrieve.
+        _type : str | type
+            Type of item to retrieve. A cargo class can be passed instead of
+            its name to match items with `isinstance`.
         """
 
-        target = None
-        for i in self.items:
-            if i.type == _type:
-                target = i
-                break
-
-        if not target:
+        target = self._find_item(_type)
+        if target is None:
             raise ItemNotFound(_type)
 
-        else:
-            res = self.get(lambda x: x == target)
-            return res.value
+        res = self.get(lambda x: x is target)
+        return res.value
 
     def any_remaining(self, _type):
         """
@@ -273,7 +268,7 @@ class VesselStorage(simpy.FilterStore):
 
         Parameters
         ----------
-        _type : str
+        _type : str | type
             Type of item to retrieve.
 
         Returns
@@ -282,17 +277,22 @@ class VesselStorage(simpy.FilterStore):
             Indicates if any items in self.items satisfy `_type`.
         """
 
-        target = None
-        for i in self.items:
-            if i.type == _type:
-                target = i
-                break
+        return self._find_item(_type) is not None
 
-        if target:
-            return True
+    def _find_item(self, _type):
+        """
+        Returns the first item in `self.items` satisfying `_type`, or None.
 
-        else:
-            return False
+        Parameters
+        ----------
+        _type : str | type
+            Type name or cargo class of item to find.
+        """
+
+        if isinstance(_type, type):
+            return next((i for i in self.items if isinstance(i, _type)), None)
+
+        return next((i for i in self.items if i.type == _type), None)
 
 
 class ScourProtectionStorage(simpy.Container):
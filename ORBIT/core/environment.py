@@ -122,14 +122,13 @@ class OrbitEnvironment(Environment):
             simplest representation.
         """
 
-        ws = {}
-        for k in list(constraints.keys()):
-            if "windspeed" in k:
-                ws[k] = constraints.pop(k)
-
+        ws = {k: v for k, v in constraints.items() if "windspeed" in k}
         if not ws:
             return constraints
 
+        for k in ws:
+            del constraints[k]
+
         if "windspeed" in self.state.dtype.names:
             if len(ws) > 1:
                 raise ValueError(
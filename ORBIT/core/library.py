@@ -38,7 +38,6 @@ from pathlib import Path
 
 import yaml
 import pandas as pd
-from yaml import Dumper
 
 from ORBIT.core.exceptions import LibraryItemNotFoundError
 
@@ -46,8 +45,13 @@ ROOT = Path(__file__).parents[2]
 default_library = ROOT / "library"
 
 
+# Use the libyaml backed parser and emitter when PyYAML was built with it
+_BaseSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+
 # Need a custom loader to read in scientific notation correctly
-class CustomSafeLoader(yaml.SafeLoader):
+class CustomSafeLoader(_BaseSafeLoader):
     """Custom loader that enables tuple sequences in YAML files."""
 
     def construct_python_tuple(self, node):
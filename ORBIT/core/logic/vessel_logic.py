@@ -153,11 +153,12 @@ def shuttle_items_to_queue(vessel, port, queue, distance, items, **kwargs):
     """
 
     transit_time = vessel.transit_time(distance)
+    at_port, at_site = f"{vessel} is at port.", f"{vessel} is at site."
 
     while True:
 
         if vessel.at_port:
-            vessel.submit_debug_log(message=f"{vessel} is at port.")
+            vessel.submit_debug_log(message=at_port)
 
             if not port.items:
                 vessel.submit_debug_log(
@@ -195,7 +196,7 @@ def shuttle_items_to_queue(vessel, port, queue, distance, items, **kwargs):
             vessel.at_site = True
 
         if vessel.at_site:
-            vessel.submit_debug_log(message=f"{vessel} is at site.")
+            vessel.submit_debug_log(message=at_site)
 
             # Join queue to be active feeder at site
             with queue.request() as req:
@@ -275,10 +276,12 @@ def get_list_of_items_from_port(vessel, port, items, **kwargs):
                     vessel.storage.current_deck_space + total_deck_space
                 )
 
+                # current_cargo_mass sums over all cargo, so read it once
+                current_mass = vessel.storage.current_cargo_mass
                 total_mass = sum([item.mass for item in buffer])
-                proposed_mass = vessel.storage.current_cargo_mass + total_mass
+                proposed_mass = current_mass + total_mass
 
-                if vessel.storage.current_cargo_mass == 0:
+                if current_mass == 0:
 
                     if proposed_deck_space > vessel.storage.max_deck_space:
 
@@ -353,18 +356,20 @@ def shuttle_items_to_queue_wait(
     """
 
     transit_time = vessel.transit_time(distance)
+    per_trip = max(per_trip, 1)
+    trip_items = items * per_trip
+    at_port, at_site = f"{vessel} is at port.", f"{vessel} is at site."
 
     n = 0
     while n < assigned:
 
-        vessel.submit_debug_log(message=f"{vessel} is at port.")
+        vessel.submit_debug_log(message=at_port)
 
         # Get list of items
-        per_trip = max([per_trip, 1])
         yield get_list_of_items_from_port_wait(
             vessel,
             port,
-            items * per_trip,
+            trip_items,
             **kwargs,
         )
 
@@ -377,7 +382,7 @@ def shuttle_items_to_queue_wait(
         )
         yield stabilize(vessel, **kwargs)
 
-        vessel.submit_debug_log(message=f"{vessel} is at site.")
+        vessel.submit_debug_log(message=at_site)
 
         # Join queue to be active feeder at site
         with queue.request() as req:
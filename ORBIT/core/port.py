@@ -64,6 +64,29 @@ class Port(simpy.FilterStore):
             res = self.get(lambda x: x == target)
             return res.value
 
+    def put_many(self, items):
+        """
+        Adds `items` to the port in a single operation instead of scheduling
+        a ``put`` event for every item. Falls back to individual puts if the
+        items would exceed the port capacity.
+
+        Intended for stocking the port during setup, before the simulation
+        starts. Pending ``get`` requests are not triggered by the added items.
+
+        Parameters
+        ----------
+        items : list
+            Items to add to the port, in order.
+        """
+
+        if len(self.items) + len(items) > self.capacity:
+            for item in items:
+                self.put(item)
+
+            return
+
+        self.items.extend(items)
+
 
 class WetStorage(simpy.Store):
     """Storage infrastructure for floating substructures."""
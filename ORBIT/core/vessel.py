@@ -41,6 +41,8 @@ class Vessel(Agent):
         self.config = config
         self.extract_vessel_dayrate()
         self.avail = avail
+        self._transit_limits = None
+        self._operational_limits = None
 
     def submit_action_log(self, action, duration, **kwargs):
         """
@@ -211,11 +213,14 @@ class Vessel(Agent):
 
         self._transport_specs = self.config.get("transport_specs", {})
         self.transit_speed = self._transport_specs.get("transit_speed", None)
+        self._transit_limits = None
+        self._operational_limits = None
 
     def extract_crane_specs(self):
         """Extracts crane specifications if found."""
 
         self._crane_specs = self.config.get("crane_specs", {})
+        self._operational_limits = None
         if self._crane_specs:
             self._crane = Crane(self._crane_specs)
 
@@ -293,8 +298,9 @@ class Vessel(Agent):
 
         Parameters
         ----------
-        _type : str
-            Type of item to retrieve.
+        _type : str | type
+            Type of item to retrieve. A cargo class can be passed instead of
+            its name.
         vessel : Vessel | None
             Optional configuration to retrieve item from different vessel.
         release : bool
@@ -368,36 +374,41 @@ class Vessel(Agent):
     def transit_limits(self):
         """
         Returns dictionary of `marmot.Constraints` for 'windspeed' and
-        'waveheight', representing the transit limits of the vessel.
+        'waveheight', representing the transit limits of the vessel. Built
+        once and shared between tasks, as marmot copies constraints when they
+        are evaluated.
         """
 
-        _dict = {
-            "windspeed": le(self._transport_specs["max_windspeed"]),
-            "waveheight": le(self._transport_specs["max_waveheight"]),
-        }
+        if self._transit_limits is None:
+            self._transit_limits = {
+                "windspeed": le(self._transport_specs["max_windspeed"]),
+                "waveheight": le(self._transport_specs["max_waveheight"]),
+            }
 
-        return _dict
+        return self._transit_limits
 
     @property
     def operational_limits(self):
         """
         Returns dictionary of `marmot.Constraints` for 'windspeed' and
         'waveheight', representing the operational limits of the vessel.
+        Built once and shared between tasks.
         """
 
-        try:
-            _ = self.crane
-            max_windspeed = self._crane_specs["max_windspeed"]
+        if self._operational_limits is None:
+            try:
+                _ = self.crane
+                max_windspeed = self._crane_specs["max_windspeed"]
 
-        except MissingComponent:
-            max_windspeed = self._transport_specs["max_windspeed"]
+            except MissingComponent:
+                max_windspeed = self._transport_specs["max_windspeed"]
 
-        _dict = {
-            "windspeed": le(max_windspeed),
-            "waveheight": le(self._transport_specs["max_waveheight"]),
-        }
+            self._operational_limits = {
+                "windspeed": le(max_windspeed),
+                "waveheight": le(self._transport_specs["max_waveheight"]),
+            }
 
-        return _dict
+        return self._operational_limits
 
     def update_trip_data(self, cargo=True, deck=True, items=True):
         """
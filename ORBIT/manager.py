@@ -434,27 +434,30 @@ class ProjectManager:
         if not add_keys:
             right = {k: right[k] for k in set(new).intersection(set(right))}
 
-        for k in right.keys():
+        elif new.keys().isdisjoint(right):
+            # No shared keys, so there is nothing to merge recursively
+            new.update(right)
+            return new
+
+        for k, val in right.items():
             if (
                 k in new
                 and isinstance(new[k], dict)
-                and isinstance(right[k], collections.Mapping)
+                and isinstance(val, collections.Mapping)
             ):
                 new[k] = cls.merge_dicts(
                     new[k],
-                    right[k],
+                    val,
                     overwrite=overwrite,
                     add_keys=add_keys,
                 )
             elif (
-                k in new
-                and isinstance(new[k], list)
-                and isinstance(right[k], list)
+                k in new and isinstance(new[k], list) and isinstance(val, list)
             ):
-                new[k].extend(right[k])
+                new[k].extend(val)
             else:
                 if overwrite or k not in new:
-                    new[k] = right[k]
+                    new[k] = val
 
                 else:
                     continue
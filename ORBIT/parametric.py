@@ -8,13 +8,15 @@ __email__ = ["jake.nunemaker@nrel.gov"]
 
 import re
 import time
+import pickle
 from copy import deepcopy
 from random import sample
+from functools import partial
 from itertools import product
+from multiprocessing import Pool
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 from benedict import benedict
 
 from ORBIT import ProjectManager
@@ -59,15 +61,43 @@ class ParametricManager:
         self.product = product
         self.keep = keep_inputs if keep_inputs is not None else []
 
-    def run(self, **kwargs):
+    def run(self, num_workers=None, **kwargs):
         """Run the configured parametric runs and save any requested results to
         `self.results`.
+
+        Parameters
+        ----------
+        num_workers : int | None
+            Number of worker processes used to complete the runs. Each run is
+            an independent simulation, so they can be split across processes.
+            Runs are completed serially if not configured. Result functions in
+            `self.funcs` must be picklable (eg. module level functions rather
+            than lambdas) to run in parallel.
+
+        Raises
+        ------
+        ValueError
+            If `num_workers` is greater than 1 and `self.funcs` can't be
+            pickled.
         """
 
-        outputs = []
-        for run in self.run_list:
-            data = self._run_config(run, **kwargs)
-            outputs.append(data)
+        runs = self.run_list
+        if num_workers is None or num_workers <= 1:
+            outputs = [self._run_config(run, **kwargs) for run in runs]
+
+        else:
+            try:
+                pickle.dumps(self.funcs)
+
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                raise ValueError(
+                    "Result functions in 'funcs' must be picklable to run in"
+                    " parallel. Use module level functions instead of lambdas"
+                    " or set 'num_workers' to None."
+                ) from e
+
+            with Pool(num_workers) as pool:
+                outputs = pool.map(partial(self._run_config, **kwargs), runs)
 
         self.results = pd.DataFrame(outputs)
 
@@ -259,6 +289,10 @@ class LinearModel:
         self.x = x
         self.y = y
 
+        # statsmodels is slow to import and only needed for linear models,
+        # so it is not imported with the rest of ORBIT
+        import statsmodels.api as sm
+
         self.X = data[x]
         self.Y = data[y]
 
@@ -335,6 +369,8 @@ class LinearModel:
         list
         """
 
+        import statsmodels.api as sm
+
         data = self.X2.copy()
 
         vif = []
@@ -7,7 +7,6 @@ __email__ = "jake.nunemaker@nrel.gov"
 
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
 
 from benedict import benedict
 
@@ -105,7 +104,9 @@ class BasePhase(ABC):
         MissingInputs
         """
 
-        expected = deepcopy(getattr(self, "expected_config", None))
+        # `_check_keys` only reads from `expected`, so the class-level
+        # `expected_config` can be used directly without a defensive copy.
+        expected = getattr(self, "expected_config", None)
         if expected is None:
             raise AttributeError(f"'expected_config' not set for '{self}'.")
 
@@ -8,6 +8,7 @@ __email__ = ["jake.nunemaker@nrel.gov", "rob.hammond@nrel.gov"]
 
 from abc import abstractmethod
 from itertools import groupby
+from collections import defaultdict
 
 import numpy as np
 import simpy
@@ -156,6 +157,20 @@ class InstallPhase(BasePhase):
 
         pass
 
+    @property
+    def operational_delays(self):
+        """
+        Gathers the operational delays of every agent from the logs in a
+        single pass, keyed by agent name.
+        """
+
+        delays = defaultdict(float)
+        for a in self.env.actions:
+            if "Delay" in a["action"]:
+                delays[a["agent"]] += a["duration"]
+
+        return delays
+
     @property
     def agent_efficiencies(self):
         """Returns a summary of agent operational efficiencies."""
@@ -227,6 +227,34 @@ def bolt_transition_piece(vessel, **kwargs):
     )
 
 
+def _pump_transition_piece_grout(vessel, **kwargs):
+    """Yields the vessel task to pump grout at the transition piece."""
+
+    key = "grout_pump_time"
+    pump_time = kwargs.get(key, pt[key])
+
+    yield vessel.task_wrapper(
+        "Pump TP Grout",
+        pump_time,
+        constraints=vessel.operational_limits,
+        **kwargs,
+    )
+
+
+def _cure_transition_piece_grout(vessel, **kwargs):
+    """Yields the vessel task to cure the transition piece grout."""
+
+    key = "grout_cure_time"
+    cure_time = kwargs.get(key, pt[key])
+
+    yield vessel.task_wrapper(
+        "Cure TP Grout",
+        cure_time,
+        constraints=vessel.transit_limits,
+        **kwargs,
+    )
+
+
 @process
 def pump_transition_piece_grout(vessel, **kwargs):
     """
@@ -242,15 +270,7 @@ def pump_transition_piece_grout(vessel, **kwargs):
     vessel.task representing time to "Pump TP Grout".
     """
 
-    key = "grout_pump_time"
-    pump_time = kwargs.get(key, pt[key])
-
-    yield vessel.task_wrapper(
-        "Pump TP Grout",
-        pump_time,
-        constraints=vessel.operational_limits,
-        **kwargs,
-    )
+    yield from _pump_transition_piece_grout(vessel, **kwargs)
 
 
 @process
@@ -268,15 +288,30 @@ def cure_transition_piece_grout(vessel, **kwargs):
     vessel.task representing time to "Cure TP Grout".
     """
 
-    key = "grout_cure_time"
-    cure_time = kwargs.get(key, pt[key])
+    yield from _cure_transition_piece_grout(vessel, **kwargs)
 
-    yield vessel.task_wrapper(
-        "Cure TP Grout",
-        cure_time,
-        constraints=vessel.transit_limits,
-        **kwargs,
-    )
+
+@process
+def grout_transition_piece(vessel, **kwargs):
+    """
+    Returns time required to pump and cure grout at the transition piece
+    interface. Equivalent to ``pump_transition_piece_grout()`` followed by
+    ``cure_transition_piece_grout()`` within a single process.
+
+    Parameters
+    ----------
+    grout_pump_time : int | float
+        Time required to pump grout at the interface.
+    grout_cure_time : int | float
+        Time required for the grout to cure.
+
+    Yields
+    ------
+    vessel.task representing time to "Pump TP Grout" and "Cure TP Grout".
+    """
+
+    yield from _pump_transition_piece_grout(vessel, **kwargs)
+    yield from _cure_transition_piece_grout(vessel, **kwargs)
 
 
 @process
@@ -331,8 +366,7 @@ def install_transition_piece(vessel, tp, **kwargs):
     `tp_connection_type='grouted'` as a `kwarg`. This process uses the
     following tasks:
 
-    - Pump grout, ``tasks.pump_transition_piece_grout()``
-    - Cure grout, ``tasks.cure_transition_piece_grout()``
+    - Pump and cure grout, ``tasks.grout_transition_piece()``
 
     Parameters
     ----------
@@ -356,9 +390,7 @@ def install_transition_piece(vessel, tp, **kwargs):
         yield bolt_transition_piece(vessel, **kwargs)
 
     elif connection == "grouted":
-
-        yield pump_transition_piece_grout(vessel, **kwargs)
-        yield cure_transition_piece_grout(vessel)
+        yield grout_transition_piece(vessel, **kwargs)
 
     else:
         raise Exception(
@@ -13,10 +13,13 @@ from ORBIT.core.logic import jackdown_if_required
 from ORBIT.core.defaults import process_times as pt
 from ORBIT.phases.install.monopile_install.common import (
     bolt_transition_piece,
-    cure_transition_piece_grout,
-    pump_transition_piece_grout,
+    grout_transition_piece,
 )
 
+TOPSIDE_FASTEN_TIME = pt["topside_fasten_time"]
+TOPSIDE_RELEASE_TIME = pt["topside_release_time"]
+TOPSIDE_ATTACH_TIME = pt["topside_attach_time"]
+
 
 class Topside(Cargo):
     """Topside Cargo."""
@@ -31,8 +34,7 @@ class Topside(Cargo):
     def fasten(**kwargs):
         """Returns time required to fasten a topside at port."""
 
-        key = "topside_fasten_time"
-        time = kwargs.get(key, pt[key])
+        time = kwargs.get("topside_fasten_time", TOPSIDE_FASTEN_TIME)
 
         return "Fasten Topside", time
 
@@ -40,8 +42,7 @@ class Topside(Cargo):
     def release(**kwargs):
         """Returns time required to release topside from fastenings."""
 
-        key = "topside_release_time"
-        time = kwargs.get(key, pt[key])
+        time = kwargs.get("topside_release_time", TOPSIDE_RELEASE_TIME)
 
         return "Release Topside", time
 
@@ -97,8 +98,7 @@ def attach_topside(vessel, **kwargs):
 
     _ = vessel.crane
 
-    key = "topside_attach_time"
-    attach_time = kwargs.get(key, pt[key])
+    attach_time = kwargs.get("topside_attach_time", TOPSIDE_ATTACH_TIME)
 
     yield vessel.task_wrapper(
         "Attach Topside",
@@ -142,9 +142,7 @@ def install_topside(vessel, topside, **kwargs):
         yield bolt_transition_piece(vessel, **kwargs)
 
     elif connection == "grouted":
-
-        yield pump_transition_piece_grout(vessel, **kwargs)
-        yield cure_transition_piece_grout(vessel, **kwargs)
+        yield grout_transition_piece(vessel, **kwargs)
 
     else:
         raise Exception(
@@ -130,9 +130,7 @@ class OffshoreSubstationInstallation(InstallPhase):
         sub = Monopile(**self.config["offshore_substation_substructure"])
         self.num_substations = self.config["num_substations"]
 
-        for _ in range(self.num_substations):
-            self.port.put(sub)
-            self.port.put(top)
+        self.port.put_many([sub, top] * self.num_substations)
 
     def initialize_oss_install_vessel(self):
         """Creates the offshore substation installation vessel object."""
@@ -236,7 +234,7 @@ def install_oss_from_queue(vessel, queue, substations, distance, **kwargs):
 
                 # Get monopile
                 monopile = yield vessel.get_item_from_storage(
-                    "Monopile",
+                    Monopile,
                     vessel=queue.vessel,
                     **kwargs,
                 )
@@ -246,7 +244,7 @@ def install_oss_from_queue(vessel, queue, substations, distance, **kwargs):
 
                 # Get topside
                 topside = yield vessel.get_item_from_storage(
-                    "Topside",
+                    Topside,
                     vessel=queue.vessel,
                     release=True,
                     **kwargs,
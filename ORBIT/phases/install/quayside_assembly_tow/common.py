@@ -11,16 +11,60 @@ __email__ = "jake.nunemaker@nrel.gov"
 from marmot import Agent, le, false, process
 from marmot._exceptions import AgentNotRegistered
 
+# Constraints are copied by marmot when a task is evaluated, so these can be
+# shared across every turbine assembly task.
+PORT_CONSTRAINTS = {"port_in_use": false()}
+LIFT_CONSTRAINTS = {"windspeed": le(15)}
+BLADE_LIFT_CONSTRAINTS = {"windspeed": le(12)}
+COMPLETION_CONSTRAINTS = {"windspeed": le(18)}
+
+
+class TaskCounter:
+    """
+    Count of remaining tasks that can be shared between agents. Used in
+    place of a shared list of placeholder tasks.
+    """
+
+    __slots__ = ("remaining",)
+
+    def __init__(self, num):
+        """
+        Creates an instance of `TaskCounter`.
+
+        Parameters
+        ----------
+        num : int
+            Number of tasks to complete.
+        """
+
+        self.remaining = num
+
+    def take(self):
+        """Claims a task. Returns `False` if no tasks remain."""
+
+        if self.remaining > 0:
+            self.remaining -= 1
+            return True
+
+        return False
+
 
 class Substructure:
     """Floating Substructure Class."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Creates an instance of `Substructure`."""
 
         pass
 
 
+# `Substructure` carries no state, so one instance is shared by every
+# completed assembly placed in wet storage.
+SUBSTRUCTURE = Substructure()
+
+
 class SubstructureAssemblyLine(Agent):
     """Substructure Assembly Line Class."""
 
@@ -30,8 +74,8 @@ class SubstructureAssemblyLine(Agent):
 
         Parameters
         ----------
-        assigned : list
-            List of assigned tasks. Can be shared with other assembly lines.
+        assigned : TaskCounter
+            Assigned tasks. Can be shared with other assembly lines.
         time : int | float
             Hours required to produce one substructure.
         target : simpy.Store
@@ -46,6 +90,9 @@ class SubstructureAssemblyLine(Agent):
         self.time = time
         self.target = target
 
+        # Unlimited storage never delays the assembly line
+        self._track_delay = target.capacity != float("inf")
+
     def submit_action_log(self, action, duration, **kwargs):
         """
         Submits a log representing a completed `action` performed over time
@@ -81,37 +128,39 @@ class SubstructureAssemblyLine(Agent):
 
             self.env._submit_log(payload, level="ACTION")
 
-    @process
     def assemble_substructure(self):
-        """Simulation process for assembling a substructure."""
+        """
+        Simulation logic for assembling a substructure. The assembly task is
+        skipped when no takt time is configured. Run inline by `start` with
+        `yield from` rather than as a separate process.
+        """
 
-        yield self.task("Substructure Assembly", self.time)
-        substructure = Substructure()
+        if self.time:
+            yield self.task("Substructure Assembly", self.time)
 
         start = self.env.now
-        yield self.target.put(substructure)
-        delay = self.env.now - start
+        yield self.target.put(SUBSTRUCTURE)
 
-        if delay > 0:
-            self.submit_action_log(
-                "Delay: No Substructure Storage Available", delay
-            )
+        if self._track_delay:
+            delay = self.env.now - start
+            if delay > 0:
+                self.submit_action_log(
+                    "Delay: No Substructure Storage Available", delay
+                )
 
     @process
     def start(self):
         """
-        Trigger the assembly line to run. Will attempt to pull a task from
+        Trigger the assembly line to run. Will attempt to claim a task from
         self.assigned and timeout for the assembly time. Shuts down after
-        self.assigned is empty.
+        all tasks in self.assigned are claimed.
         """
 
-        while True:
-            try:
-                _ = self.assigned.pop(0)
-                yield self.assemble_substructure()
+        take = self.assigned.take
+        assemble = self.assemble_substructure
 
-            except IndexError:
-                break
+        while take():
+            yield from assemble()
 
 
 class TurbineAssemblyLine(Agent):
@@ -127,6 +176,8 @@ class TurbineAssemblyLine(Agent):
             Storage for completed substructures.
         target : simpy.Store
             Target storage.
+        turbine : dict
+            Turbine configuration.
         num : int
             Assembly line number designation.
         """
@@ -136,6 +187,7 @@ class TurbineAssemblyLine(Agent):
         self.feed = feed
         self.target = target
         self.turbine = turbine
+        self.tower_sections = turbine["tower"].get("sections", 1)
 
     def submit_action_log(self, action, duration, **kwargs):
         """
@@ -180,17 +232,20 @@ class TurbineAssemblyLine(Agent):
         self.assigned is empty.
         """
 
+        env = self.env
+        feed_get = self.feed.get
+        log = self.submit_action_log
+        assemble = self.assemble_turbine
+
         while True:
-            start = self.env.now
-            _ = yield self.feed.get()
-            delay = self.env.now - start
+            start = env.now
+            _ = yield feed_get()
+            delay = env.now - start
 
             if delay > 0:
-                self.submit_action_log(
-                    "Delay: No Substructures in Wet Storage", delay
-                )
+                log("Delay: No Substructures in Wet Storage", delay)
 
-            yield self.assemble_turbine()
+            yield assemble()
 
     @process
     def assemble_turbine(self):
@@ -198,122 +253,70 @@ class TurbineAssemblyLine(Agent):
         Turbine assembly process. Follows a similar process as the
         `TurbineInstallation` modules but has fixed lift times + fasten times
         instead of calculating the lift times dynamically.
-        """
-
-        yield self.move_substructure()
-        yield self.prepare_for_assembly()
-
-        sections = self.turbine["tower"].get("sections", 1)
-        for _ in range(sections):
-            yield self.lift_and_attach_tower_section()
 
-        yield self.lift_and_attach_nacelle()
+        Tasks:
 
-        for _ in range(3):
-            yield self.lift_and_attach_blade()
-
-        yield self.mechanical_completion()
-
-        yield self.electrical_completion()
-
-        start = self.env.now
-        yield self.target.put(1)
-        delay = self.env.now - start
+        - Move the completed substructure assembly to the turbine assembly
+          line. TODO: Move to dynamic process involving tow groups.
+        - Prepare the substructure for turbine assembly.
+        - Lift and attach each tower section.
+        - Lift and attach the nacelle.
+        - Lift and attach three blades.
+        - Mechanical completion work at quayside.
+        - Electrical completion work at quayside, including precommissioning.
+          Assumes the tower is delivered to port in multiple sections,
+          requiring cable pull-in after tower assembly.
 
-        if delay > 0:
-            self.submit_action_log(
-                "Delay: No Assembly Storage Available", delay
-            )
-
-        self.submit_debug_log(
-            message="Assembly delievered to installation groups."
-        )
-
-    @process
-    def move_substructure(self):
-        """
-        Task representing time associated with moving the completed
-        substructure assembly to the turbine assembly line.
-
-        TODO: Move to dynamic process involving tow groups.
-        """
-
-        yield self.task("Move Substructure", 8, {"port_in_use": false()})
-
-    @process
-    def prepare_for_assembly(self):
-        """
-        Task representing time associated with preparing a substructure for
-        turbine assembly.
+        Each task is yielded directly rather than wrapped in its own process
+        to avoid spawning a sub-process per task.
         """
 
+        yield self.task("Move Substructure", 8, PORT_CONSTRAINTS)
         yield self.task("Prepare for Turbine Assembly", 12)
 
-    @process
-    def lift_and_attach_tower_section(self):
-        """
-        Task representing time associated with lifting and attaching a tower
-        section at quayside.
-        """
-
-        yield self.task(
-            "Lift and Attach Tower Section",
-            4,
-            constraints={"windspeed": le(15)},
-        )
-
-    @process
-    def lift_and_attach_nacelle(self):
-        """
-        Task representing time associated with lifting and attaching a nacelle
-        at quayside.
-        """
+        for _ in range(self.tower_sections):
+            yield self.task(
+                "Lift and Attach Tower Section",
+                4,
+                constraints=LIFT_CONSTRAINTS,
+            )
 
         yield self.task(
             "Lift and Attach Nacelle",
             12,
-            constraints={"windspeed": le(15)},
-        )
-
-    @process
-    def lift_and_attach_blade(self):
-        """
-        Task representing time associated with lifting and attaching a turbine
-        blade at quayside.
-        """
-
-        yield self.task(
-            "Lift and Attach Blade",
-            3.5,
-            constraints={"windspeed": le(12)},
+            constraints=LIFT_CONSTRAINTS,
         )
 
-    @process
-    def mechanical_completion(self):
-        """
-        Task representing time associated with performing mechanical compltion
-        work at quayside.
-        """
+        for _ in range(3):
+            yield self.task(
+                "Lift and Attach Blade",
+                3.5,
+                constraints=BLADE_LIFT_CONSTRAINTS,
+            )
 
         yield self.task(
             "Mechanical Completion",
             24,
-            constraints={"windspeed": le(18)},
+            constraints=COMPLETION_CONSTRAINTS,
         )
 
-    @process
-    def electrical_completion(self):
-        """
-        Task representing time associated with performing electrical completion
-        work at quayside, including precommissioning. Assumes the tower is
-        delivered to port in multiple sections, requiring cable pull-in after
-        tower assembly.
-        """
-
         yield self.task(
             "Electrical Completion",
             72,
-            constraints={"windspeed": le(18)},
+            constraints=COMPLETION_CONSTRAINTS,
+        )
+
+        start = self.env.now
+        yield self.target.put(1)
+        delay = self.env.now - start
+
+        if delay > 0:
+            self.submit_action_log(
+                "Delay: No Assembly Storage Available", delay
+            )
+
+        self.submit_debug_log(
+            message="Assembly delievered to installation groups."
         )
 
 
@@ -360,6 +363,11 @@ class TowingGroup(Agent):
                 ahts_vessel_specs["transport_specs"]["transit_speed"],
             )
 
+        self.transit_limits = {
+            "windspeed": le(self.max_windspeed),
+            "waveheight": le(self.max_waveheight),
+        }
+
     def initialize(self):
         """Initializes the towing group."""
 
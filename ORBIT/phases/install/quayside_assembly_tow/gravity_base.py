@@ -13,7 +13,12 @@ from marmot import le, process
 from ORBIT.core import WetStorage
 from ORBIT.phases.install import InstallPhase
 
-from .common import TowingGroup, TurbineAssemblyLine, SubstructureAssemblyLine
+from .common import (
+    TaskCounter,
+    TowingGroup,
+    TurbineAssemblyLine,
+    SubstructureAssemblyLine,
+)
 
 
 class GravityBasedInstallation(InstallPhase):
@@ -103,28 +108,16 @@ class GravityBasedInstallation(InstallPhase):
         - self.config["port"]["sub_assembly_lines"]
         """
 
-        try:
-            storage = self.config["port"]["sub_storage"]
-
-        except KeyError:
-            storage = float("inf")
+        port_config = self.config.get("port", {})
+        storage = port_config.get("sub_storage", float("inf"))
 
         self.wet_storage = WetStorage(self.env, storage)
 
-        try:
-            time = self.config["substructure"]["takt_time"]
-
-        except KeyError:
-            time = 0
-
-        try:
-            lines = self.config["port"]["sub_assembly_lines"]
-
-        except KeyError:
-            lines = 1
+        time = self.config.get("substructure", {}).get("takt_time", 0)
+        lines = port_config.get("sub_assembly_lines", 1)
 
         num = self.config["plant"]["num_turbines"]
-        to_assemble = [1] * num
+        to_assemble = TaskCounter(num)
 
         self.sub_assembly_lines = []
         for i in range(lines):
@@ -149,19 +142,12 @@ class GravityBasedInstallation(InstallPhase):
         - self.config["port"]["turb_assembly_lines"]
         """
 
-        try:
-            storage = self.config["port"]["assembly_storage"]
-
-        except KeyError:
-            storage = float("inf")
+        port_config = self.config.get("port", {})
+        storage = port_config.get("assembly_storage", float("inf"))
 
         self.assembly_storage = WetStorage(self.env, storage)
 
-        try:
-            lines = self.config["port"]["turbine_assembly_cranes"]
-
-        except KeyError:
-            lines = 1
+        lines = port_config.get("turbine_assembly_cranes", 1)
 
         turbine = self.config["turbine"]
         self.turbine_assembly_lines = []
@@ -185,9 +171,10 @@ class GravityBasedInstallation(InstallPhase):
 
         self.installation_groups = []
 
+        groups_config = self.config["towing_vessel_groups"]
         vessel = self.config["towing_vessel"]
-        num_groups = self.config["towing_vessel_groups"].get("num_groups", 1)
-        towing = self.config["towing_vessel_groups"]["towing_vessels"]
+        num_groups = groups_config.get("num_groups", 1)
+        towing = groups_config["towing_vessels"]
         towing_speed = self.config["substructure"].get("towing_speed", 6)
 
         for i in range(num_groups):
@@ -245,7 +232,8 @@ class GravityBasedInstallation(InstallPhase):
         vessel.initialize(mobilize=False)
         self.support_vessel = vessel
 
-        station_keeping_vessels = self.config["towing_vessel_groups"].get(
+        groups_config = self.config["towing_vessel_groups"]
+        station_keeping_vessels = groups_config.get(
             "station_keeping_vessels", None
         )
 
@@ -258,9 +246,7 @@ class GravityBasedInstallation(InstallPhase):
                 stacklevel=2,
             )
 
-        station_keeping_vessels = self.config["towing_vessel_groups"].get(
-            "ahts_vessels", 1
-        )
+        station_keeping_vessels = groups_config.get("ahts_vessels", 1)
 
         install_gravity_base_foundations(
             self.support_vessel,
@@ -275,24 +261,16 @@ class GravityBasedInstallation(InstallPhase):
     def detailed_output(self):
         """Compiles the detailed installation phase outputs."""
 
+        delays = self.operational_delays
+        agents = [
+            *self.sub_assembly_lines,
+            *self.turbine_assembly_lines,
+            *self.installation_groups,
+            self.support_vessel,
+        ]
+
         return {
-            "operational_delays": {
-                **{
-                    k: self.operational_delay(str(k))
-                    for k in self.sub_assembly_lines
-                },
-                **{
-                    k: self.operational_delay(str(k))
-                    for k in self.turbine_assembly_lines
-                },
-                **{
-                    k: self.operational_delay(str(k))
-                    for k in self.installation_groups
-                },
-                self.support_vessel: self.operational_delay(
-                    str(self.support_vessel)
-                ),
-            },
+            "operational_delays": {k: delays.get(str(k), 0) for k in agents},
         }
 
     def operational_delay(self, name):
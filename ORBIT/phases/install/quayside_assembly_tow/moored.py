@@ -14,7 +14,15 @@ from marmot import le, process
 from ORBIT.core import WetStorage
 from ORBIT.phases.install import InstallPhase
 
-from .common import TowingGroup, TurbineAssemblyLine, SubstructureAssemblyLine
+from .common import (
+    TaskCounter,
+    TowingGroup,
+    TurbineAssemblyLine,
+    SubstructureAssemblyLine,
+)
+
+# Weather limits for the towing group while working at site.
+SITE_LIMITS = {"windspeed": le(15), "waveheight": le(2.5)}
 
 
 class MooredSubInstallation(InstallPhase):
@@ -110,27 +118,15 @@ class MooredSubInstallation(InstallPhase):
         - self.config["port"]["sub_assembly_lines"]
         """
 
-        try:
-            storage = self.config["port"]["sub_storage"]
-
-        except KeyError:
-            storage = float("inf")
+        port_config = self.config.get("port", {})
+        storage = port_config.get("sub_storage", float("inf"))
 
         self.wet_storage = WetStorage(self.env, storage)
 
-        try:
-            time = self.config["substructure"]["takt_time"]
-
-        except KeyError:
-            time = 0
+        time = self.config.get("substructure", {}).get("takt_time", 0)
+        lines = port_config.get("sub_assembly_lines", 1)
 
-        try:
-            lines = self.config["port"]["sub_assembly_lines"]
-
-        except KeyError:
-            lines = 1
-
-        to_assemble = [1] * self.num_turbines
+        to_assemble = TaskCounter(self.num_turbines)
 
         self.sub_assembly_lines = []
         for i in range(lines):
@@ -155,19 +151,12 @@ class MooredSubInstallation(InstallPhase):
         - self.config["port"]["turb_assembly_lines"]
         """
 
-        try:
-            storage = self.config["port"]["assembly_storage"]
-
-        except KeyError:
-            storage = float("inf")
+        port_config = self.config.get("port", {})
+        storage = port_config.get("assembly_storage", float("inf"))
 
         self.assembly_storage = WetStorage(self.env, storage)
 
-        try:
-            lines = self.config["port"]["turbine_assembly_cranes"]
-
-        except KeyError:
-            lines = 1
+        lines = port_config.get("turbine_assembly_cranes", 1)
 
         turbine = self.config["turbine"]
         self.turbine_assembly_lines = []
@@ -183,7 +172,7 @@ class MooredSubInstallation(InstallPhase):
             a.start()
             self.turbine_assembly_lines.append(a)
 
-    def initialize_towing_groups(self, **kwargs):
+    def initialize_towing_groups(self):
         """
         Initializes towing groups to bring completed assemblies to site and
         stabilize the assembly during final installation.
@@ -191,13 +180,14 @@ class MooredSubInstallation(InstallPhase):
 
         self.installation_groups = []
 
+        groups_config = self.config["towing_vessel_groups"]
         towing_vessel = self.config["towing_vessel"]
-        num_groups = self.config["towing_vessel_groups"].get("num_groups", 1)
-        num_towing = self.config["towing_vessel_groups"]["towing_vessels"]
+        num_groups = groups_config.get("num_groups", 1)
+        num_towing = groups_config["towing_vessels"]
         towing_speed = self.config["substructure"].get("towing_speed", 6)
 
         ahts_vessel = self.config.get("ahts_vessel", None)
-        num_ahts = self.config["towing_vessel_groups"].get("ahts_vessels", 1)
+        num_ahts = groups_config.get("ahts_vessels", 1)
 
         if ahts_vessel is None:
             warn(
@@ -207,7 +197,7 @@ class MooredSubInstallation(InstallPhase):
             )
             num_ahts = 0
 
-        remaining_substructures = [1] * self.num_turbines
+        remaining_substructures = TaskCounter(self.num_turbines)
 
         for i in range(num_groups):
             g = TowingGroup(towing_vessel, ahts_vessel, i + 1)
@@ -223,7 +213,6 @@ class MooredSubInstallation(InstallPhase):
                 num_ahts,
                 towing_speed,
                 remaining_substructures,
-                **kwargs,
             )
 
     def initialize_queue(self):
@@ -288,24 +277,15 @@ class MooredSubInstallation(InstallPhase):
     def detailed_output(self):
         """Return detailed outputs."""
 
+        delays = self.operational_delays
+        agents = [
+            *self.sub_assembly_lines,
+            *self.turbine_assembly_lines,
+            *self.installation_groups,
+        ]
+
         return {
-            "operational_delays": {
-                **{
-                    k: self.operational_delay(str(k))
-                    for k in self.sub_assembly_lines
-                },
-                **{
-                    k: self.operational_delay(str(k))
-                    for k in self.turbine_assembly_lines
-                },
-                **{
-                    k: self.operational_delay(str(k))
-                    for k in self.installation_groups
-                },
-                # self.support_vessel: self.operational_delay(
-                #    str(self.support_vessel)
-                # ),
-            },
+            "operational_delays": {k: delays.get(str(k), 0) for k in agents},
         }
 
     def operational_delay(self, name):
@@ -326,42 +306,39 @@ def transfer_install_moored_substructures_from_storage(
     ahts_vessels,
     towing_speed,
     remaining_substructures,
-    **kwargs,
 ):
     """
-    Trigger the substructure installtions. Shuts down after
-    self.remaining_substructures is empty.
+    Trigger the substructure installtions. Shuts down after all tasks in
+    `remaining_substructures`, a `TaskCounter` shared between towing
+    groups, are claimed.
     """
 
-    while True:
-        try:
-            _ = remaining_substructures.pop(0)
-            yield towing_group_actions(
-                group,
-                feed,
-                distance,
-                towing_vessels,
-                ahts_vessels,
-                towing_speed,
-                **kwargs,
-            )
+    towing_time = distance / towing_speed
+    transit_time = distance / group.transit_speed
 
-        except IndexError:
-            break
+    while remaining_substructures.take():
+        yield from towing_group_actions(
+            group,
+            feed,
+            towing_time,
+            transit_time,
+            towing_vessels,
+            ahts_vessels,
+        )
 
 
-@process
 def towing_group_actions(
     group,
     feed,
-    distance,
+    towing_time,
+    transit_time,
     towing_vessels,
     ahts_vessels,
-    towing_speed,
 ):
     """
-    Process logic for the towing vessel group. Assumes there is an
-    anchor tug boat with each group.
+    Logic for a single tow and installation by the towing vessel group.
+    Assumes there is an anchor tug boat with each group. Run inline by
+    `transfer_install_moored_substructures_from_storage` with `yield from`.
 
     Parameters
     ----------
@@ -369,19 +346,16 @@ def towing_group_actions(
         Towing group.
     feed : simpy.Store
         Completed assembly storage.
-    distance : int | float
-        Distance from port to site.
+    towing_time : int | float
+        Time to tow an assembly from port to site (h).
+    transit_time : int | float
+        Time for the group to transit back to port (h).
     towing_vessels : int
         Number of vessels to use for towing to site.
     ahts_vessels : int
         Number of anchor handling tug vessels.
-    towing_speed : int | float
-        Configured towing speed (km/h).
     """
 
-    towing_time = distance / towing_speed
-    transit_time = distance / group.transit_speed
-
     start = group.env.now
     _ = yield feed.get()
     delay = group.env.now - start
@@ -399,10 +373,7 @@ def towing_group_actions(
         6,
         num_vessels=towing_vessels,
         num_ahts_vessels=ahts_vessels,
-        constraints={
-            "windspeed": le(group.max_windspeed),
-            "waveheight": le(group.max_waveheight),
-        },
+        constraints=group.transit_limits,
     )
 
     yield group.group_task(
@@ -410,10 +381,7 @@ def towing_group_actions(
         towing_time,
         num_vessels=towing_vessels,
         num_ahts_vessels=ahts_vessels,
-        constraints={
-            "windspeed": le(group.max_windspeed),
-            "waveheight": le(group.max_waveheight),
-        },
+        constraints=group.transit_limits,
     )
 
     # At Site
@@ -422,7 +390,7 @@ def towing_group_actions(
         2,
         num_vessels=towing_vessels,
         num_ahts_vessels=ahts_vessels,
-        constraints={"windspeed": le(15), "waveheight": le(2.5)},
+        constraints=SITE_LIMITS,
     )
 
     yield group.group_task(
@@ -430,7 +398,7 @@ def towing_group_actions(
         6,
         num_vessels=towing_vessels,
         num_ahts_vessels=ahts_vessels,
-        constraints={"windspeed": le(15), "waveheight": le(2.5)},
+        constraints=SITE_LIMITS,
     )
 
     yield group.group_task(
@@ -439,7 +407,7 @@ def towing_group_actions(
         num_vessels=towing_vessels,
         num_ahts_vessels=ahts_vessels,
         suspendable=True,
-        constraints={"windspeed": le(15), "waveheight": le(2.5)},
+        constraints=SITE_LIMITS,
     )
 
     yield group.group_task(
@@ -448,7 +416,7 @@ def towing_group_actions(
         num_vessels=towing_vessels,
         num_ahts_vessels=ahts_vessels,
         suspendable=True,
-        constraints={"windspeed": le(15), "waveheight": le(2.5)},
+        constraints=SITE_LIMITS,
     )
 
     group.submit_debug_log(progress="Substructure")
@@ -460,10 +428,7 @@ def towing_group_actions(
         num_vessels=towing_vessels,
         num_ahts_vessels=ahts_vessels,
         suspendable=True,
-        constraints={
-            "windspeed": le(group.max_windspeed),
-            "waveheight": le(group.max_waveheight),
-        },
+        constraints=group.transit_limits,
     )
 
 
@@ -512,24 +477,24 @@ def install_moored_substructures(
             yield vessel.task_wrapper(
                 "Position Substructure",
                 2,
-                constraints={"windspeed": le(15), "waveheight": le(2.5)},
+                constraints=SITE_LIMITS,
             )
             yield vessel.task_wrapper(
                 "Ballast to Operational Draft",
                 6,
-                constraints={"windspeed": le(15), "waveheight": le(2.5)},
+                constraints=SITE_LIMITS,
             )
             yield vessel.task_wrapper(
                 "Connect Mooring Lines",
                 22,
                 suspendable=True,
-                constraints={"windspeed": le(15), "waveheight": le(2.5)},
+                constraints=SITE_LIMITS,
             )
             yield vessel.task_wrapper(
                 "Check Mooring Lines",
                 12,
                 suspendable=True,
-                constraints={"windspeed": le(15), "waveheight": le(2.5)},
+                constraints=SITE_LIMITS,
             )
 
             group_time = vessel.env.now - start
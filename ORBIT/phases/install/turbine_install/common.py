@@ -11,6 +11,16 @@ from marmot import process
 from ORBIT.core import Cargo
 from ORBIT.core.defaults import process_times as pt
 
+TOWER_SECTION_FASTEN_TIME = pt["tower_section_fasten_time"]
+TOWER_SECTION_RELEASE_TIME = pt["tower_section_release_time"]
+NACELLE_FASTEN_TIME = pt["nacelle_fasten_time"]
+NACELLE_RELEASE_TIME = pt["nacelle_release_time"]
+BLADE_FASTEN_TIME = pt["blade_fasten_time"]
+BLADE_RELEASE_TIME = pt["blade_release_time"]
+NACELLE_ATTACH_TIME = pt["nacelle_attach_time"]
+BLADE_ATTACH_TIME = pt["blade_attach_time"]
+TOWER_SECTION_ATTACH_TIME = pt["tower_section_attach_time"]
+
 
 class TowerSection(Cargo):
     """Tower Section Cargo."""
@@ -26,8 +36,9 @@ class TowerSection(Cargo):
     def fasten(**kwargs):
         """Returns time required to fasten a tower section at port."""
 
-        key = "tower_section_fasten_time"
-        time = kwargs.get(key, pt[key])
+        time = kwargs.get(
+            "tower_section_fasten_time", TOWER_SECTION_FASTEN_TIME
+        )
 
         return "Fasten Tower Section", time
 
@@ -35,8 +46,9 @@ class TowerSection(Cargo):
     def release(**kwargs):
         """Returns time required to release tower section from fastenings."""
 
-        key = "tower_section_release_time"
-        time = kwargs.get(key, pt[key])
+        time = kwargs.get(
+            "tower_section_release_time", TOWER_SECTION_RELEASE_TIME
+        )
 
         return "Release Tower Section", time
 
@@ -54,8 +66,7 @@ class Nacelle(Cargo):
     def fasten(**kwargs):
         """Returns time required to fasten a nacelle at port."""
 
-        key = "nacelle_fasten_time"
-        time = kwargs.get(key, pt[key])
+        time = kwargs.get("nacelle_fasten_time", NACELLE_FASTEN_TIME)
 
         return "Fasten Nacelle", time
 
@@ -63,8 +74,7 @@ class Nacelle(Cargo):
     def release(**kwargs):
         """Returns time required to release nacelle from fastenings."""
 
-        key = "nacelle_release_time"
-        time = kwargs.get(key, pt[key])
+        time = kwargs.get("nacelle_release_time", NACELLE_RELEASE_TIME)
 
         return "Release Nacelle", time
 
@@ -83,8 +93,7 @@ class Blade(Cargo):
     def fasten(**kwargs):
         """Returns time required to fasten a blade at port."""
 
-        key = "blade_fasten_time"
-        time = kwargs.get(key, pt[key])
+        time = kwargs.get("blade_fasten_time", BLADE_FASTEN_TIME)
 
         return "Fasten Blade", time
 
@@ -92,8 +101,7 @@ class Blade(Cargo):
     def release(**kwargs):
         """Returns time required to release blade from fastenings."""
 
-        key = "blade_release_time"
-        time = kwargs.get(key, pt[key])
+        time = kwargs.get("blade_release_time", BLADE_RELEASE_TIME)
 
         return "Release Blade", time
 
@@ -145,8 +153,7 @@ def attach_nacelle(vessel, **kwargs):
     """
 
     _ = vessel.crane
-    key = "nacelle_attach_time"
-    attach_time = kwargs.get(key, pt[key])
+    attach_time = kwargs.get("nacelle_attach_time", NACELLE_ATTACH_TIME)
 
     yield vessel.task_wrapper(
         "Attach Nacelle",
@@ -203,8 +210,7 @@ def attach_turbine_blade(vessel, **kwargs):
     """
 
     _ = vessel.crane
-    key = "blade_attach_time"
-    attach_time = kwargs.get(key, pt[key])
+    attach_time = kwargs.get("blade_attach_time", BLADE_ATTACH_TIME)
 
     yield vessel.task_wrapper(
         "Attach Blade",
@@ -260,8 +266,9 @@ def attach_tower_section(vessel, **kwargs):
     """
 
     _ = vessel.crane
-    key = "tower_section_attach_time"
-    attach_time = kwargs.get(key, pt[key])
+    attach_time = kwargs.get(
+        "tower_section_attach_time", TOWER_SECTION_ATTACH_TIME
+    )
 
     yield vessel.task_wrapper(
         "Attach Tower Section",
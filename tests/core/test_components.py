@@ -4,3 +4,39 @@ __author__ = "Jake Nunemaker"
 __copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
 __maintainer__ = "Jake Nunemaker"
 __email__ = "jake.nunemaker@nrel.gov"
+
+import pytest
+from marmot import Environment
+
+from ORBIT.core import Cargo
+from ORBIT.core.components import VesselStorage
+from ORBIT.core.exceptions import ItemNotFound
+
+
+class SampleItem(Cargo):
+    def __init__(self):
+        pass
+
+
+class OtherItem(Cargo):
+    def __init__(self):
+        pass
+
+
+@pytest.mark.parametrize("_type", ("SampleItem", SampleItem))
+def test_vessel_storage_get_item(_type):
+
+    env = Environment()
+    storage = VesselStorage(env, 100, 100, 100)
+    other, item = OtherItem(), SampleItem()
+
+    storage.put_item(other)
+    storage.put_item(item)
+
+    assert storage.any_remaining(_type)
+    assert storage.get_item(_type) is item
+    assert storage.any_remaining(_type) is False
+    assert storage.items == [other]
+
+    with pytest.raises(ItemNotFound):
+        _ = storage.get_item(_type)
@@ -51,3 +51,34 @@ def test_get_item():
     _ = port.get_item("SampleItem")
     with pytest.raises(ItemNotFound):
         _ = port.get_item("SampleItem")
+
+
+def test_put_many():
+
+    env = Environment()
+    port = Port(env)
+    a = SampleItem()
+    b = {"type": "Other"}
+
+    port.put_many([a, b] * 3)
+    assert port.items == [a, b] * 3
+
+    returned = port.get_item("SampleItem")
+    assert returned == a
+    assert len(port.items) == 5
+
+
+def test_put_many_over_capacity():
+
+    env = Environment()
+    port = Port(env, capacity=2)
+    item = SampleItem()
+
+    port.put_many([item] * 3)
+    assert len(port.items) == 2
+    assert len(port.put_queue) == 1
+
+    _ = port.get_item("SampleItem")
+    env.run()
+    assert len(port.items) == 2
+    assert not port.put_queue
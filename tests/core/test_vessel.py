@@ -4,3 +4,24 @@ __author__ = "Jake Nunemaker"
 __copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
 __maintainer__ = "Jake Nunemaker"
 __email__ = "jake.nunemaker@nrel.gov"
+
+
+def test_vessel_limits(env, wtiv, feeder):
+
+    for vessel in (wtiv, feeder):
+        env.register(vessel)
+        vessel.initialize()
+
+    transport = wtiv.config["transport_specs"]
+    crane = wtiv.config["crane_specs"]
+
+    assert wtiv.transit_limits is wtiv.transit_limits
+    assert wtiv.transit_limits["windspeed"].val == transport["max_windspeed"]
+    assert wtiv.operational_limits is wtiv.operational_limits
+    assert wtiv.operational_limits["windspeed"].val == crane["max_windspeed"]
+
+    # Vessels without a crane operate to their transport limits
+    assert (
+        feeder.operational_limits["windspeed"].val
+        == feeder.config["transport_specs"]["max_windspeed"]
+    )
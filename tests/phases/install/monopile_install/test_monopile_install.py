@@ -16,6 +16,10 @@ from tests.data import test_weather
 from ORBIT.core.library import extract_library_specs
 from ORBIT.core.defaults import process_times as pt
 from ORBIT.phases.install import MonopileInstallation
+from ORBIT.phases.install.monopile_install.common import (
+    Monopile,
+    TransitionPiece,
+)
 
 config_wtiv = extract_library_specs("config", "single_wtiv_mono_install")
 config_wtiv_feeder = extract_library_specs("config", "multi_wtiv_mono_install")
@@ -93,6 +97,27 @@ def test_for_complete_logging(weather, config):
     _ = sim.detailed_output
 
 
+def test_feeders_respect_assignments_below_one_set_per_trip():
+
+    config = deepcopy(config_wtiv_multi_feeder)
+    config["monopile"]["deck_space"] = 900
+
+    sim = MonopileInstallation(config)
+    assert sim.sets_per_trip == 0
+
+    # Surplus sets at port shouldn't be picked up by the feeders
+    for _ in range(2):
+        sim.port.put(Monopile(**config["monopile"]))
+        sim.port.put(TransitionPiece(**config["transition_piece"]))
+
+    sim.run()
+
+    df = pd.DataFrame(sim.env.actions)
+    trips = df.loc[df["action"] == "ActiveFeeder", "agent"].value_counts()
+    assert trips.to_dict() == {"Feeder 0": 10, "Feeder 1": 10}
+    assert len(sim.port.items) == 4
+
+
 def test_kwargs():
 
     sim = MonopileInstallation(config_wtiv)
@@ -216,3 +241,13 @@ def test_grout_kwargs():
 
     assert "Pump TP Grout" in [a["action"] for a in sim.env.actions]
     assert "Cure TP Grout" in [a["action"] for a in sim.env.actions]
+
+    baseline = sim.total_phase_time
+    sim = MonopileInstallation(
+        config_wtiv,
+        tp_connection_type="grouted",
+        grout_cure_time=pt["grout_cure_time"] + 2,
+    )
+    sim.run()
+
+    assert sim.total_phase_time > baseline
@@ -14,6 +14,7 @@ from ORBIT.phases.install.monopile_install.common import (
     lower_monopile,
     upend_monopile,
     bolt_transition_piece,
+    grout_transition_piece,
     lower_transition_piece,
     cure_transition_piece_grout,
     pump_transition_piece_grout,
@@ -30,6 +31,8 @@ from ORBIT.phases.install.monopile_install.common import (
         (bolt_transition_piece, "Bolt TP", []),
         (pump_transition_piece_grout, "Pump TP Grout", []),
         (cure_transition_piece_grout, "Cure TP Grout", []),
+        (grout_transition_piece, "Pump TP Grout", []),
+        (grout_transition_piece, "Cure TP Grout", []),
     ],
 )
 def test_task(env, wtiv, task, log, args):
@@ -11,6 +11,7 @@ import pytest
 
 from ORBIT.core import WetStorage
 from ORBIT.phases.install.quayside_assembly_tow.common import (
+    TaskCounter,
     TurbineAssemblyLine,
     SubstructureAssemblyLine,
 )
@@ -30,6 +31,7 @@ from ORBIT.phases.install.quayside_assembly_tow.common import (
 def test_SubstructureAssemblyLine(env, num, assigned, expected):
 
     _assigned = len(assigned)
+    assigned = TaskCounter(_assigned)
     storage = WetStorage(env, capacity=float("inf"))
 
     for a in range(num):
@@ -43,6 +45,22 @@ def test_SubstructureAssemblyLine(env, num, assigned, expected):
     assert env.now == expected
 
 
+def test_SubstructureAssemblyLine_no_takt_time(env):
+
+    assigned = TaskCounter(10)
+    storage = WetStorage(env, capacity=float("inf"))
+
+    assembly = SubstructureAssemblyLine(assigned, 0, storage, 1)
+    env.register(assembly)
+    assembly.start()
+
+    env.run()
+
+    assert len(storage.items) == 10
+    assert not env.actions
+    assert env.now == 0
+
+
 @pytest.mark.parametrize(
     "num, assigned",
     [
@@ -97,7 +115,7 @@ def test_TurbineAssemblyLine(env, num, assigned):
 def test_Sub_to_Turbine_assembly_interaction(env, sub_lines, turb_lines):
 
     num_turbines = 50
-    assigned = [1] * num_turbines
+    assigned = TaskCounter(num_turbines)
 
     feed = WetStorage(env, capacity=2)
     target = WetStorage(env, capacity=float("inf"))
@@ -61,6 +61,23 @@ def test_for_complete_logging(weather, config):
     _ = sim.detailed_output
 
 
+def test_detailed_output_delays():
+
+    sim = GravityBasedInstallation(no_supply, weather=test_weather)
+    sim.run()
+
+    delays = sim.detailed_output["operational_delays"]
+    assert len(delays) == (
+        len(sim.sub_assembly_lines)
+        + len(sim.turbine_assembly_lines)
+        + len(sim.installation_groups)
+        + 1
+    )
+
+    for agent, delay in delays.items():
+        assert delay == pytest.approx(sim.operational_delay(str(agent)))
+
+
 def test_deprecated_vessel():
 
     deprecated = deepcopy(config)
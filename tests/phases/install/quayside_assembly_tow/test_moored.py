@@ -93,6 +93,22 @@ def test_for_complete_logging(weather, config):
     assert installed_mooring_lines == sim.num_turbines
 
 
+def test_detailed_output_delays():
+
+    sim = MooredSubInstallation(no_supply, weather=test_weather)
+    sim.run()
+
+    delays = sim.detailed_output["operational_delays"]
+    assert len(delays) == (
+        len(sim.sub_assembly_lines)
+        + len(sim.turbine_assembly_lines)
+        + len(sim.installation_groups)
+    )
+
+    for agent, delay in delays.items():
+        assert delay == pytest.approx(sim.operational_delay(str(agent)))
+
+
 def test_deprecated_vessel():
 
     deprecated = deepcopy(config)
@@ -23,6 +23,10 @@ params = {"site.distance": [20, 40, 60]}
 funcs = {"bos_capex": lambda project: project.bos_capex}
 
 
+def get_bos_capex(project):
+    return project.bos_capex
+
+
 def test_for_equal_results():
 
     config = benedict(deepcopy(complete_project))
@@ -36,6 +40,28 @@ def test_for_equal_results():
     assert df.loc[20]["bos_capex"] == project.bos_capex
 
 
+def test_parallel_runs():
+
+    serial = ParametricManager(complete_project, params, funcs)
+    serial.run()
+
+    parallel = ParametricManager(
+        complete_project,
+        params,
+        {"bos_capex": get_bos_capex},
+    )
+    parallel.run(num_workers=2)
+
+    pd.testing.assert_frame_equal(parallel.results, serial.results)
+
+
+def test_parallel_runs_unpicklable_funcs():
+
+    parametric = ParametricManager(complete_project, params, funcs)
+    with pytest.raises(ValueError):
+        parametric.run(num_workers=2)
+
+
 def test_weather():
 
     without = ParametricManager(complete_project, params, funcs)
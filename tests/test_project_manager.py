@@ -109,6 +109,23 @@ def test_expected_config_merging():
     }
 
 
+def test_disjoint_config_merging():
+    """Tests merging of configs that don't share any keys."""
+
+    config1 = {"site": {"distance": "float"}, "turbines": ["a"]}
+    config2 = {"plant": {"num_turbines": "int"}}
+
+    config = ProjectManager.merge_dicts(config1, config2)
+
+    assert config == {
+        "site": {"distance": "float"},
+        "turbines": ["a"],
+        "plant": {"num_turbines": "int"},
+    }
+    assert config is not config1
+    assert "plant" not in config1
+
+
 def test_find_key_match():
     class SpecificTurbineInstallation(InstallPhase):
         expected_config = {}